@@ -16,25 +16,29 @@ import re
 import sys
 import os
 import select
+import selectors
 import termios
 import tty
 import signal
-import requests
 import socket
 import json
 import platform
+import argparse
+import codecs
+import shutil
 import logging
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from urllib.parse import urlparse
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Tuple
-from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Optional, List, Dict, Any, Tuple, Callable, Iterator, Iterable
+from concurrent.futures import ThreadPoolExecutor, Future, wait
 from enum import Flag, auto
 import queue
 import threading
 from collections import deque
+from itertools import islice
 
 # Rich UI imports (con fallback)
 try:
@@ -58,12 +62,39 @@ except ImportError:
     print("⚠️  Rich non disponibile. Installa con: pip install rich")
     print("    Verrà usata l'interfaccia TUI base.\n")
 
+# JSON veloce per l'IPC MPV (opzionale, fallback su json della stdlib)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serializza in JSON UTF-8 (orjson se disponibile)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def _json_loads(data: bytes) -> Any:
+    """Decodifica JSON da bytes (orjson se disponibile)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Piattaforma rilevata una volta sola (platform.system() non è gratuito)
+IS_WINDOWS = platform.system() == "Windows"
+
+# Pulizia schermo + cursore in alto a sinistra (ANSI, valida anche su Windows 10+)
+_CLEAR_SEQ = "\x1b[2J\x1b[H"
+
 # Importazioni condizionali per Windows
-if platform.system() == "Windows":
+if IS_WINDOWS:
     import msvcrt
+    import ctypes
     try:
         import win32gui
         import win32con
+        import win32file
         WIN32_AVAILABLE = True
     except ImportError:
         WIN32_AVAILABLE = False
@@ -128,12 +159,27 @@ class UpdateFlags(Flag):
 # MODELLI DATI
 # ============================================================================
 
-@dataclass
 class RadioStation:
     """Rappresenta una stazione radio con metadata estesi"""
-    name: str
-    url: str
-    metadata: Dict[str, str] = field(default_factory=dict)
+    
+    # __slots__ invece di @dataclass(slots=True) (richiede Python 3.10):
+    # niente __dict__ per istanza su playlist con migliaia di stazioni
+    __slots__ = ('name', 'url', 'metadata')
+    
+    def __init__(self, name: str, url: str, metadata: Optional[Dict[str, str]] = None):
+        self.name = name
+        self.url = url
+        self.metadata: Dict[str, str] = metadata if metadata is not None else {}
+    
+    def __repr__(self) -> str:
+        return f"RadioStation(name={self.name!r}, url={self.url!r}, metadata={self.metadata!r})"
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RadioStation):
+            return NotImplemented
+        return (self.name, self.url, self.metadata) == (other.name, other.url, other.metadata)
+    
+    __hash__ = None  # istanze mutabili: non hashabili
     
     def __str__(self) -> str:
         return self.name
@@ -164,7 +210,8 @@ class StreamInfo:
     pause_start_time: Optional[float] = None
     total_pause_time: float = 0.0
     
-    def get_song_time(self, is_playing: bool, is_paused: bool) -> str:
+    def get_song_time(self, is_playing: bool, is_paused: bool,
+                      now: Optional[float] = None) -> str:
         """Calcola il tempo del brano corrente"""
         if not self.song_start_time or not is_playing:
             return "00:00"
@@ -172,7 +219,7 @@ class StreamInfo:
         if is_paused and self.pause_start_time:
             elapsed = self.pause_start_time - self.song_start_time - self.total_pause_time
         else:
-            elapsed = time.time() - self.song_start_time - self.total_pause_time
+            elapsed = (now or time.monotonic()) - self.song_start_time - self.total_pause_time
         
         elapsed = max(0, elapsed)
         minutes = int(elapsed // 60)
@@ -184,7 +231,7 @@ class StreamInfo:
         if not self.start_time or not is_playing or is_paused:
             return "00:00"
         
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         hours = int(elapsed // 3600)
         minutes = int((elapsed % 3600) // 60)
         seconds = int(elapsed % 60)
@@ -230,26 +277,47 @@ class MetadataHistory:
     def export(self, path: Path):
         """Esporta la cronologia in JSON"""
         try:
+            # Serializzazione in memoria e una sola scrittura: json.dump su
+            # file emette una write() per ogni frammento del documento
+            data = json.dumps(list(self.history), indent=2, ensure_ascii=False)
             with open(path, 'w', encoding='utf-8') as f:
-                json.dump(list(self.history), f, indent=2, ensure_ascii=False)
+                f.write(data)
             logger.info(f"Cronologia esportata in {path}")
         except Exception as e:
             logger.error(f"Errore esportazione cronologia: {e}")
     
     def get_last(self, n: int = 10) -> List[Dict]:
         """Restituisce gli ultimi n brani"""
-        return list(self.history)[-n:]
+        # Solo gli ultimi n, senza copiare l'intera cronologia
+        last = list(islice(reversed(self.history), n))
+        last.reverse()
+        return last
 
 # ============================================================================
 # PARSER M3U ESTESO
 # ============================================================================
 
+# Regex precompilate: _EXTINF_RE serve solo da fallback per righe EXTINF
+# irregolari, _ATTR_RE estrae gli attributi chiave="valore"
+_EXTINF_RE = re.compile(r'#EXTINF:(-?\d+)\s*(.*?),(.+)')
+_ATTR_RE = re.compile(r'(\w+(?:-\w+)*)="([^"]+)"')
+
+# Schemi degli stream più comuni: riconosciuti senza passare da urlparse
+_STREAM_SCHEMES = ('http://', 'https://', 'rtsp://', 'rtmp://', 'mms://', 'icyx://')
+_MAX_URL_LENGTH = 4096  # righe più lunghe non sono URL di stream plausibili
+
 class M3UParser:
     """Parser M3U con supporto attributi estesi e gruppi"""
     
     @staticmethod
     def is_valid_url(url: str) -> bool:
         """Verifica se l'URL è valido"""
+        if len(url) >= _MAX_URL_LENGTH:
+            return False
+        # Percorso rapido: schema noto seguito da un host
+        if url.startswith(_STREAM_SCHEMES):
+            host = url.partition('://')[2]
+            return bool(host) and host[0] not in '/?#'
         try:
             result = urlparse(url)
             return all([result.scheme, result.netloc])
@@ -257,21 +325,31 @@ class M3UParser:
             logger.warning(f"URL non valido: {url} - {e}")
             return False
     
+    @staticmethod
+    def _sniff_encoding(file_path: Path) -> str:
+        """Rileva la codifica dal BOM iniziale (default UTF-8)"""
+        with open(file_path, 'rb') as f:
+            head = f.read(4)
+        if head.startswith(b'\xef\xbb\xbf'):
+            return 'utf-8-sig'
+        if head.startswith((b'\xff\xfe', b'\xfe\xff')):
+            return 'utf-16'
+        return 'utf-8'
+    
     def parse_file(self, file_path: Path) -> List[RadioStation]:
         """Analizza un file M3U e restituisce le stazioni"""
         logger.info(f"Parsing file M3U: {file_path}")
         
         try:
-            # Prova UTF-8, poi fallback a latin-1
+            # Lettura in streaming riga per riga, senza caricare tutto il file
+            encoding = self._sniff_encoding(file_path)
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                with open(file_path, 'r', encoding=encoding) as f:
+                    return self.parse_lines(f)
             except UnicodeDecodeError:
-                logger.warning("UTF-8 fallito, uso latin-1")
+                logger.warning(f"{encoding} fallito, uso latin-1")
                 with open(file_path, 'r', encoding='latin-1') as f:
-                    content = f.read()
-            
-            return self.parse_string(content)
+                    return self.parse_lines(f)
             
         except Exception as e:
             logger.error(f"Errore lettura file M3U: {e}", exc_info=True)
@@ -279,117 +357,359 @@ class M3UParser:
     
     def parse_string(self, content: str) -> List[RadioStation]:
         """Analizza il contenuto M3U"""
-        stations = []
-        lines = [line.strip() for line in content.split('\n')]
+        return self.parse_lines(content.splitlines())
+    
+    @staticmethod
+    def _parse_extinf(line: str) -> Optional[Dict[str, str]]:
+        """Parse: #EXTINF:duration attr1="val1" attr2="val2",Title"""
+        rest = line[8:]
+        
+        # Separatore del titolo: prima virgola fuori dalle virgolette
+        # (gli attributi possono contenere virgole, es. group-title="Rock, Pop")
+        comma = rest.find(',')
+        while comma != -1 and rest.count('"', 0, comma) % 2:
+            comma = rest.find(',', comma + 1)
+        
+        head = rest[:comma].split(None, 1) if comma != -1 else []
+        title = rest[comma + 1:]
+        if head and title and head[0].lstrip('-').isdigit():
+            duration = head[0]
+            attrs_str = head[1] if len(head) > 1 else ""
+        else:
+            # Forme irregolari (es. durata attaccata agli attributi)
+            match = _EXTINF_RE.match(line)
+            if not match:
+                return None
+            duration, attrs_str, title = match.groups()
+        
+        # Estrai attributi chiave="valore"
+        attrs = dict(_ATTR_RE.findall(attrs_str))
+        attrs['title'] = title.strip()
+        attrs['duration'] = duration
+        return attrs
+    
+    def parse_lines(self, lines: Iterable[str]) -> List[RadioStation]:
+        """Analizza le righe M3U in un unico passaggio"""
+        stations = list(self.iter_stations(lines))
+        logger.info(f"Parsate {len(stations)} stazioni")
+        return stations
+    
+    def iter_stations(self, lines: Iterable[str]) -> Iterator[RadioStation]:
+        """Genera le stazioni man mano che le righe vengono lette"""
+        is_valid_url = self.is_valid_url
+        count = 0
         
         current_attrs = {}
         
         for line in lines:
+            line = line.strip()
             if line.startswith('#EXTINF:'):
-                # Parse: #EXTINF:duration attr1="val1" attr2="val2",Title
-                match = re.match(r'#EXTINF:(-?\d+)\s*(.*?),(.+)', line)
-                if match:
-                    duration, attrs_str, title = match.groups()
-                    
-                    # Estrai attributi chiave="valore"
-                    attrs = dict(re.findall(r'(\w+(?:-\w+)*)="([^"]+)"', attrs_str))
-                    attrs['title'] = title.strip()
-                    attrs['duration'] = duration
+                attrs = self._parse_extinf(line)
+                if attrs is not None:
                     current_attrs = attrs
-                    
                     logger.debug(f"Parsed EXTINF: {attrs}")
                 else:
                     logger.warning(f"EXTINF non parsabile: {line}")
-                    
+                
             elif line.startswith('#EXTGRP:'):
                 # Gruppo alternativo
                 group = line.replace('#EXTGRP:', '').strip()
                 current_attrs['group-title'] = group
                 
             elif line and not line.startswith('#'):
-                if self.is_valid_url(line):
-                    name = current_attrs.get('title', f'Station {len(stations)+1}')
-                    station = RadioStation(
+                if is_valid_url(line):
+                    count += 1
+                    name = current_attrs.get('title', f'Station {count}')
+                    logger.debug(f"Aggiunta stazione: {name}")
+                    yield RadioStation(
                         name=name,
                         url=line,
-                        metadata=current_attrs.copy()
+                        metadata=current_attrs
                     )
-                    stations.append(station)
-                    logger.debug(f"Aggiunta stazione: {name}")
                     current_attrs = {}
                 else:
                     logger.warning(f"URL non valido ignorato: {line}")
-        
-        logger.info(f"Parsate {len(stations)} stazioni")
-        return stations
 
 # ============================================================================
 # CLIENT IPC MPV MIGLIORATO
 # ============================================================================
 
+@dataclass
+class _PendingReply:
+    """Risposta attesa su una richiesta IPC inviata sulla connessione persistente"""
+    event: threading.Event = field(default_factory=threading.Event)
+    response: Optional[Dict[str, Any]] = None
+
 class MPVIPCClient:
     """Client IPC per comunicare con MPV tramite socket"""
     
-    def __init__(self, socket_path: str):
+    def __init__(self, socket_path: str,
+                 event_callback: Optional[Callable[[Dict[str, Any]], None]] = None):
         self.socket_path = socket_path
+        self.event_callback = event_callback
         self._request_id = 0
+        self._lock = threading.Lock()
+        
+        # Connessione persistente: un solo thread lettore riceve sia gli
+        # eventi (property-change) sia le risposte, smistate per request_id
+        self._sock: Optional[socket.socket] = None
+        self._pipe_handle = None  # Windows: handle della pipe degli eventi
+        self._cmd_handle = None   # Windows: handle persistente della pipe dei comandi
+        self._cmd_buffer = b""
+        self._cmd_lock = threading.Lock()
+        self._pending: Dict[int, _PendingReply] = {}
+        self._observed: Tuple[str, ...] = ()  # riusate in caso di riconnessione
+        # JSON già codificato dei comandi ripetuti (volume, muto, get_property)
+        self._encoded_commands: Dict[tuple, bytes] = {}
         logger.info(f"Inizializzato MPV IPC client: {socket_path}")
     
+    @property
+    def is_connected(self) -> bool:
+        """True se la connessione persistente è aperta"""
+        return self._sock is not None or self._pipe_handle is not None
+    
+    def connect(self, observed: Tuple[str, ...] = ()) -> bool:
+        """Apre la connessione persistente e sottoscrive le proprietà in observed"""
+        self.close()
+        self._observed = tuple(observed)
+        # Ogni connessione ha le sue risposte in attesa: il lettore di una
+        # connessione chiusa non sblocca quelle della successiva
+        self._pending = {}
+        
+        # Le sottoscrizioni vengono scritte prima di avviare il lettore:
+        # su Windows lettura e scrittura sulla stessa pipe si bloccano a vicenda
+        payload = b"".join(
+            _json_dumps({"command": ["observe_property", obs_id, name]}) + b"\n"
+            for obs_id, name in enumerate(observed, 1)
+        )
+        
+        try:
+            if IS_WINDOWS:
+                lines = self._connect_windows(payload)
+            else:
+                lines = self._connect_unix(payload)
+        except Exception as e:
+            logger.debug(f"Connessione IPC non riuscita: {e}")
+            self.close()
+            return False
+        
+        threading.Thread(
+            target=self._read_loop, args=(lines, self._pending),
+            name="RadioPlayer-ipc", daemon=True
+        ).start()
+        logger.info(f"Connessione IPC persistente aperta ({len(observed)} proprietà osservate)")
+        return True
+    
+    def _connect_unix(self, payload: bytes) -> Iterator[bytes]:
+        """Connette il socket Unix e restituisce l'iteratore delle righe ricevute"""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.socket_path)
+            if payload:
+                sock.sendall(payload)
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        return sock.makefile('rb')
+    
+    def _connect_windows(self, payload: bytes) -> Iterator[bytes]:
+        """Apre la named pipe degli eventi e restituisce l'iteratore delle righe"""
+        if not WIN32_AVAILABLE:
+            raise RuntimeError("win32file non disponibile per IPC Windows")
+        
+        handle = win32file.CreateFile(
+            self.socket_path,
+            win32file.GENERIC_READ | win32file.GENERIC_WRITE,
+            0, None,
+            win32file.OPEN_EXISTING,
+            0, None
+        )
+        if payload:
+            win32file.WriteFile(handle, payload)
+        self._pipe_handle = handle
+        
+        def read_lines() -> Iterator[bytes]:
+            buffer = b""
+            while True:
+                _, data = win32file.ReadFile(handle, 65536)
+                if not data:
+                    return
+                buffer += data
+                *lines, buffer = buffer.split(b"\n")
+                yield from lines
+        
+        return read_lines()
+    
+    def close(self):
+        """Chiude la connessione persistente (il thread lettore termina da solo)"""
+        sock, self._sock = self._sock, None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+        
+        handle, self._pipe_handle = self._pipe_handle, None
+        if handle is not None:
+            try:
+                win32file.CloseHandle(handle)
+            except Exception:
+                pass
+        
+        # Sotto _cmd_lock, come i comandi: chiamata a MPV già terminato, un
+        # comando in corso esce con pipe rotta e rilascia il lock
+        with self._cmd_lock:
+            self._close_command_pipe()
+    
+    def _read_loop(self, lines: Iterator[bytes], pending_replies: Dict[int, _PendingReply]):
+        """Thread lettore: smista eventi e risposte finché la connessione è aperta"""
+        try:
+            for line in lines:
+                self._dispatch(line, pending_replies)
+        except Exception as e:
+            if self.is_connected:
+                logger.warning(f"Connessione IPC interrotta: {e}")
+        finally:
+            # Sblocca chi è ancora in attesa di una risposta
+            for pending in list(pending_replies.values()):
+                pending.event.set()
+            logger.info("Thread lettore IPC terminato")
+    
+    def _dispatch(self, line: bytes, pending_replies: Dict[int, _PendingReply]):
+        """Interpreta una riga JSON ricevuta da MPV"""
+        line = line.strip()
+        if not line:
+            return
+        
+        try:
+            message = _json_loads(line)
+        except ValueError:
+            logger.warning(f"Riga IPC non valida: {line[:100]!r}")
+            return
+        
+        if "event" in message:
+            if self.event_callback:
+                try:
+                    self.event_callback(message)
+                except Exception as e:
+                    logger.error(f"Errore gestione evento IPC: {e}", exc_info=True)
+            return
+        
+        pending = pending_replies.pop(message.get("request_id"), None)
+        if pending is not None:
+            pending.response = message
+            pending.event.set()
+    
     def send_command(self, command: str, *args, timeout: float = 2.0) -> Optional[Any]:
         """Invia un comando a MPV e attende la risposta"""
-        self._request_id += 1
-        request = {
-            "command": [command, *args],
-            "request_id": self._request_id
-        }
+        with self._lock:
+            self._request_id += 1
+            request = {
+                "command": [command, *args],
+                "request_id": self._request_id
+            }
         
         logger.debug(f"IPC send: {request}")
         
         try:
-            if platform.system() == "Windows":
-                return self._send_windows(request, timeout)
+            message = self._encode_request(request["command"], request["request_id"])
+            if IS_WINDOWS:
+                return self._send_windows(request, message, timeout)
+            elif self._sock is not None:
+                return self._send_persistent(request, message, timeout)
             else:
-                return self._send_unix(request, timeout)
+                return self._send_unix(request, message, timeout)
         except Exception as e:
             logger.error(f"Errore IPC command '{command}': {e}")
             return None
     
-    def _send_unix(self, request: dict, timeout: float) -> Optional[Any]:
-        """Invia comando su Unix socket"""
-        if not os.path.exists(self.socket_path):
-            logger.warning(f"Socket non esiste: {self.socket_path}")
+    def _encode_request(self, command: list, request_id: int) -> bytes:
+        """Serializza la richiesta riusando il JSON già codificato del comando"""
+        # Anche i tipi nella chiave: True == 1 ma in JSON sono diversi
+        key = (tuple(command), tuple(map(type, command)))
+        try:
+            encoded = self._encoded_commands.get(key)
+        except TypeError:  # argomenti non hashabili: niente cache
+            key, encoded = None, None
+        if encoded is None:
+            encoded = _json_dumps(command)
+            if key is not None and len(self._encoded_commands) < 128:
+                self._encoded_commands[key] = encoded
+        return b'{"command": %s, "request_id": %d}\n' % (encoded, request_id)
+    
+    def _send_persistent(self, request: dict, message: bytes, timeout: float,
+                         retry: bool = True) -> Optional[Any]:
+        """Invia comando sulla connessione persistente; la risposta arriva dal lettore"""
+        request_id = request["request_id"]
+        pending = _PendingReply()
+        pending_replies = self._pending
+        pending_replies[request_id] = pending
+        
+        try:
+            with self._lock:
+                self._sock.sendall(message)
+        except (BrokenPipeError, ConnectionResetError) as e:
+            pending_replies.pop(request_id, None)
+            # Connessione caduta: una sola riconnessione, poi si rinuncia
+            if retry and self.connect(self._observed):
+                logger.info(f"Connessione IPC ripristinata dopo: {e}")
+                return self._send_persistent(request, message, timeout, retry=False)
+            logger.error(f"Errore IPC persistente: {e}")
+            return None
+        except (OSError, AttributeError) as e:
+            pending_replies.pop(request_id, None)
+            logger.error(f"Errore IPC persistente: {e}")
             return None
         
+        if not pending.event.wait(timeout):
+            pending_replies.pop(request_id, None)
+            logger.warning(f"IPC timeout per comando: {request['command'][0]}")
+            return None
+        
+        response = pending.response
+        if response is None:
+            return None  # connessione chiusa durante l'attesa
+        
+        logger.debug(f"IPC response: {response}")
+        if response.get("error") == "success":
+            return response.get("data")
+        logger.warning(f"IPC error: {response.get('error')}")
+        return None
+    
+    def _send_unix(self, request: dict, message: bytes, timeout: float) -> Optional[Any]:
+        """Invia comando su Unix socket (connessione singola, senza lettore)"""
+        # Nessun stat() preventivo: un socket assente fa fallire connect()
         try:
             with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
                 sock.settimeout(timeout)
                 sock.connect(self.socket_path)
-                sock.sendall((json.dumps(request) + "\n").encode('utf-8'))
-                
-                # Leggi risposta completa
-                buffer = b""
-                while True:
-                    chunk = sock.recv(4096)
-                    if not chunk:
-                        break
-                    buffer += chunk
-                    if b"\n" in buffer:
-                        break
+                sock.sendall(message)
                 
-                if buffer:
-                    response = json.loads(buffer.decode('utf-8').strip())
+                # Una riga JSON per messaggio: salta gli eventi che MPV può
+                # inviare prima della risposta e legge fino al request_id atteso
+                for line in sock.makefile('rb'):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    response = _json_loads(line)
+                    if "event" in response:
+                        continue
                     logger.debug(f"IPC response: {response}")
                     
-                    if response.get("request_id") == self._request_id:
+                    if response.get("request_id") == request["request_id"]:
                         if response.get("error") == "success":
                             return response.get("data")
-                        else:
-                            logger.warning(f"IPC error: {response.get('error')}")
-                    else:
-                        logger.warning(f"Request ID mismatch: {response.get('request_id')} != {self._request_id}")
+                        logger.warning(f"IPC error: {response.get('error')}")
+                        return None
+                    logger.warning(f"Request ID mismatch: {response.get('request_id')} != {request['request_id']}")
                 
                 return None
                 
+        except FileNotFoundError:
+            logger.warning(f"Socket non esiste: {self.socket_path}")
+            return None
         except socket.timeout:
             logger.warning(f"IPC timeout per comando: {request['command'][0]}")
             return None
@@ -397,41 +717,74 @@ class MPVIPCClient:
             logger.error(f"Errore IPC Unix: {e}")
             return None
     
-    def _send_windows(self, request: dict, timeout: float) -> Optional[Any]:
-        """Invia comando su Windows named pipe"""
-        try:
-            import win32file
-            import win32pipe
-            import pywintypes
-            
-            handle = win32file.CreateFile(
-                self.socket_path,
-                win32file.GENERIC_READ | win32file.GENERIC_WRITE,
-                0, None,
-                win32file.OPEN_EXISTING,
-                0, None
-            )
-            
-            message = (json.dumps(request) + "\n").encode('utf-8')
-            win32file.WriteFile(handle, message)
-            
-            result, data = win32file.ReadFile(handle, 4096)
-            win32file.CloseHandle(handle)
-            
-            if data:
-                response = json.loads(data.decode('utf-8').strip())
-                logger.debug(f"IPC response: {response}")
-                
-                if response.get("error") == "success":
-                    return response.get("data")
-            
-            return None
-            
-        except ImportError:
+    def _send_windows(self, request: dict, message: bytes, timeout: float) -> Optional[Any]:
+        """Invia comando sulla named pipe Windows dei comandi (aperta una volta sola)"""
+        if not WIN32_AVAILABLE:
             logger.error("win32file non disponibile per IPC Windows")
             return None
-        except Exception as e:
-            logger.error(f"Errore IPC Windows: {e}")
+        
+        # La pipe degli eventi è occupata dalla ReadFile bloccante del lettore:
+        # i comandi viaggiano su una seconda pipe persistente, un comando alla volta
+        with self._cmd_lock:
+            for retry in (True, False):
+                try:
+                    if self._cmd_handle is None:
+                        self._open_command_pipe()
+                    win32file.WriteFile(self._cmd_handle, message)
+                    return self._read_command_reply(request["request_id"])
+                except Exception as e:
+                    self._close_command_pipe()
+                    # Pipe chiusa (MPV riavviato): una sola riapertura, poi si rinuncia
+                    if not retry:
+                        logger.error(f"Errore IPC Windows: {e}")
+        return None
+    
+    def _open_command_pipe(self):
+        """Apre la pipe dei comandi e disattiva gli eventi che non verrebbero letti"""
+        handle = win32file.CreateFile(
+            self.socket_path,
+            win32file.GENERIC_READ | win32file.GENERIC_WRITE,
+            0, None,
+            win32file.OPEN_EXISTING,
+            0, None
+        )
+        win32file.WriteFile(handle, b'{"command": ["disable_event", "all"]}\n')
+        self._cmd_handle = handle
+        self._cmd_buffer = b""
+    
+    def _close_command_pipe(self):
+        handle, self._cmd_handle = self._cmd_handle, None
+        self._cmd_buffer = b""
+        if handle is not None:
+            try:
+                win32file.CloseHandle(handle)
+            except Exception:
+                pass
+    
+    def _read_command_reply(self, request_id: int) -> Optional[Any]:
+        """Legge dalla pipe dei comandi fino alla risposta con il request_id atteso"""
+        while True:
+            line, sep, rest = self._cmd_buffer.partition(b"\n")
+            if not sep:
+                _, data = win32file.ReadFile(self._cmd_handle, 4096)
+                if not data:
+                    raise ConnectionResetError("pipe dei comandi chiusa")
+                self._cmd_buffer += data
+                continue
+            self._cmd_buffer = rest
+            
+            # Parsing direttamente sui bytes; le risposte senza request_id
+            # (es. disable_event) o di richieste scadute vengono scartate
+            if not line.strip():
+                continue
+            response = _json_loads(line)
+            if "event" in response or response.get("request_id") != request_id:
+                continue
+            logger.debug(f"IPC response: {response}")
+            
+            if response.get("error") == "success":
+                return response.get("data")
+            logger.warning(f"IPC error: {response.get('error')}")
             return None
     
     def get_property(self, property_name: str) -> Optional[Any]:
@@ -443,105 +796,6 @@ class MPVIPCClient:
         result = self.send_command("set_property", property_name, value)
         return result is not None
 
-# ============================================================================
-# MONITOR METADATA CON THREAD POOL
-# ============================================================================
-
-class MetadataMonitor:
-    """Monitora i metadata dello stream radio"""
-
-    def __init__(self, update_callback):
-        self.update_callback = update_callback
-        self.running = False
-        self.current_url = None
-        self._response = None  # risposta HTTP attiva, chiudibile da stop()
-        logger.info("Inizializzato MetadataMonitor")
-
-    def start(self, url: str):
-        self.current_url = url
-        self.running = True
-        logger.info(f"Avviato monitoraggio metadata per: {url}")
-
-    def stop(self):
-        self.running = False
-        self.current_url = None
-        # Chiude la connessione attiva: interrompe il read() bloccante nel thread
-        resp = self._response
-        if resp is not None:
-            self._response = None
-            try:
-                resp.close()
-            except Exception:
-                pass
-        logger.info("Fermato monitoraggio metadata")
-
-    def monitor_loop(self):
-        """Loop di monitoraggio metadata ICY"""
-        while self.running and self.current_url:
-            resp = None
-            try:
-                headers = {'Icy-MetaData': '1', 'User-Agent': 'RadioPlayer/2.0'}
-                resp = requests.get(
-                    self.current_url, headers=headers, stream=True, timeout=5
-                )
-                self._response = resp
-
-                icy_bitrate = resp.headers.get('icy-br', '')
-                if icy_bitrate:
-                    self.update_callback('bitrate', f"{icy_bitrate} kbps")
-
-                metaint = resp.headers.get('icy-metaint')
-                if not metaint:
-                    logger.debug("Nessun icy-metaint, attendo...")
-                    time.sleep(5)
-                    continue
-
-                metaint = int(metaint)
-                logger.debug(f"ICY metaint: {metaint}")
-
-                while self.running:
-                    try:
-                        audio_data = resp.raw.read(metaint)
-                        if not audio_data:
-                            break
-
-                        meta_length_byte = resp.raw.read(1)
-                        if not meta_length_byte:
-                            break
-
-                        meta_length = ord(meta_length_byte) * 16
-
-                        if meta_length > 0:
-                            metadata = resp.raw.read(meta_length)
-                            metadata_str = metadata.decode('utf-8', errors='ignore')
-                            title_match = re.search(r"StreamTitle='([^']*)'", metadata_str)
-                            if title_match:
-                                stream_title = title_match.group(1).strip()
-                                if stream_title:
-                                    self.update_callback('stream_title', stream_title)
-                                    logger.info(f"Metadata ICY: {stream_title}")
-                    except Exception:
-                        # Connessione chiusa da stop() o errore di rete
-                        break
-
-            except requests.RequestException as e:
-                if self.running:
-                    logger.warning(f"Errore richiesta metadata: {e}")
-                    time.sleep(5)
-            except Exception as e:
-                if self.running:
-                    logger.error(f"Errore monitor metadata: {e}", exc_info=True)
-                    time.sleep(5)
-            finally:
-                if resp is not None:
-                    try:
-                        resp.close()
-                    except Exception:
-                        pass
-                self._response = None
-
-        logger.info("Loop metadata terminato")
-
 # ============================================================================
 # CLIENT RADIOBROWSER.INFO
 # ============================================================================
@@ -556,10 +810,21 @@ class RadioBrowserAPI:
     HEADERS = {"User-Agent": "RadioPlayerM3U/2.0 azanzani@gmail.com"}
     _working_base: Optional[str] = None  # cache classe: evita retry SSL ad ogni ricerca
 
+    def __init__(self):
+        # Sessione HTTP creata alla prima ricerca: la connessione TLS resta
+        # aperta (keep-alive) tra le ricerche successive mentre si digita
+        self._session = None
+
     def _get(self, path: str, params: dict) -> Optional[Any]:
         """Tenta la richiesta su tutti gli endpoint, cachando quello funzionante."""
+        # Import ritardato: requests/urllib3 servono solo se si apre la ricerca
+        import requests
         import urllib3
 
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update(self.HEADERS)
+
         # Metti in cima l'URL già funzionante, se noto
         bases = []
         if self._working_base:
@@ -571,10 +836,9 @@ class RadioBrowserAPI:
                 if not verify:
                     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
                 try:
-                    resp = requests.get(
+                    resp = self._session.get(
                         f"{base}{path}",
                         params=params,
-                        headers=self.HEADERS,
                         timeout=8,
                         verify=verify,
                     )
@@ -642,24 +906,67 @@ class RadioBrowserAPI:
 class MPVController:
     """Gestisce il processo MPV e la comunicazione IPC"""
     
-    def __init__(self, socket_path: str):
+    # Proprietà spinte da MPV con observe_property (niente polling)
+    OBSERVED_PROPERTIES = (
+        "metadata",
+        "audio-bitrate",
+        "audio-codec-name",
+        "demuxer-cache-duration",
+        "paused-for-cache",
+        "cache-buffering-state",
+    )
+    
+    def __init__(self, socket_path: str,
+                 property_callback: Optional[Callable[[str, Any], None]] = None):
         self.socket_path = socket_path
         self.process: Optional[subprocess.Popen] = None
-        self.ipc_client = MPVIPCClient(socket_path)
+        self.property_callback = property_callback
+        self.ipc_client = MPVIPCClient(socket_path, self._on_ipc_event)
+        # Ultimo valore ricevuto per ogni proprietà osservata
+        self._properties: Dict[str, Any] = {}
         logger.info("Inizializzato MPVController")
     
-    def start(self, url: str, volume: int = 50) -> bool:
+    def _on_ipc_event(self, message: Dict[str, Any]):
+        """Eventi IPC (thread lettore): memorizza e inoltra i property-change"""
+        if message.get("event") != "property-change":
+            return
+        
+        name = message.get("name")
+        value = message.get("data")
+        # Variazioni sotto la precisione mostrata (cache a 0.1 s, bitrate in
+        # kbps) non cambiano l'interfaccia: niente riformattazione né callback
+        unchanged = (name in self._properties
+                     and self._display_value(name, value)
+                         == self._display_value(name, self._properties[name]))
+        self._properties[name] = value
+        if unchanged:
+            return
+        if self.property_callback:
+            self.property_callback(name, value)
+    
+    @staticmethod
+    def _display_value(name: str, value: Any) -> Any:
+        """Valore alla precisione con cui viene mostrato"""
+        if value is None:
+            return None
+        if name == "audio-bitrate":
+            return int(value / 1000)
+        if name == "demuxer-cache-duration":
+            return round(value, 1)
+        return value
+    
+    def start(self, url: str, volume: int = 50, muted: bool = False) -> bool:
         """Avvia MPV con lo stream"""
         try:
             # Rimuovi socket esistente
-            if platform.system() != "Windows" and os.path.exists(self.socket_path):
-                os.remove(self.socket_path)
+            if self._remove_socket():
                 logger.debug("Rimosso socket esistente")
             
             cmd = [
                 'mpv',
                 '--no-video',
                 f'--volume={volume}',
+                f'--mute={"yes" if muted else "no"}',
                 '--quiet',
                 '--no-terminal',
                 '--cache=yes',
@@ -675,14 +982,20 @@ class MPVController:
                 cmd,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
-                preexec_fn=os.setsid if platform.system() != "Windows" else None
+                start_new_session=True  # setsid() senza hook Python nel figlio (ignorato su Windows)
             )
             
-            # Attendi che il socket sia pronto
-            for _ in range(20):  # Max 2 secondi
-                time.sleep(0.1)
-                if platform.system() != "Windows" and os.path.exists(self.socket_path):
+            # Attendi che il socket sia pronto e apri la connessione persistente:
+            # la connessione riuscita è il segnale di MPV pronto (di solito < 100 ms)
+            self._properties.clear()
+            for _ in range(100):  # Max 2 secondi
+                time.sleep(0.02)
+                if self.process.poll() is not None:
                     break
+                if self.ipc_client.connect(self.OBSERVED_PROPERTIES):
+                    break
+            else:
+                logger.warning("Connessione IPC non disponibile: niente metadata/statistiche")
             
             if self.process.poll() is None:
                 logger.info("MPV avviato con successo")
@@ -702,19 +1015,20 @@ class MPVController:
         
         try:
             logger.info("Fermata MPV")
-            if platform.system() == "Windows":
+            if IS_WINDOWS:
                 self.process.terminate()
                 self.process.wait(timeout=2)
             else:
-                os.killpg(os.getpgid(self.process.pid), signal.SIGTERM)
+                # start_new_session: il pid di MPV è anche l'id del suo gruppo
+                os.killpg(self.process.pid, signal.SIGTERM)
                 self.process.wait(timeout=2)
         except subprocess.TimeoutExpired:
             logger.warning("MPV non risponde, force kill")
             try:
-                if platform.system() == "Windows":
+                if IS_WINDOWS:
                     self.process.kill()
                 else:
-                    os.killpg(os.getpgid(self.process.pid), signal.SIGKILL)
+                    os.killpg(self.process.pid, signal.SIGKILL)
             except:
                 pass
         except Exception as e:
@@ -722,12 +1036,27 @@ class MPVController:
         finally:
             self.process = None
             
+            # IPC chiuso solo a MPV terminato: il lettore riceve EOF/pipe rotta,
+            # mentre CloseHandle su una ReadFile sincrona in corso resterebbe
+            # bloccata fino al prossimo evento di MPV (Windows)
+            self.ipc_client.close()
+            
             # Pulisci socket
-            if platform.system() != "Windows" and os.path.exists(self.socket_path):
-                try:
-                    os.remove(self.socket_path)
-                except:
-                    pass
+            self._remove_socket()
+    
+    def _remove_socket(self) -> bool:
+        """Rimuove il socket Unix di MPV (True se esisteva)"""
+        if IS_WINDOWS:
+            return False
+        # Niente os.path.exists(): la remove stessa segnala l'assenza
+        try:
+            os.remove(self.socket_path)
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.debug(f"Rimozione socket fallita: {e}")
+            return False
     
     def is_running(self) -> bool:
         """Verifica se MPV è in esecuzione"""
@@ -741,27 +1070,26 @@ class MPVController:
         """Imposta muto"""
         return self.ipc_client.set_property("mute", muted)
     
-    def get_audio_stats(self) -> Dict[str, Any]:
-        """Ottiene statistiche audio"""
+    def get_observed_stats(self) -> Dict[str, Any]:
+        """Statistiche audio dalle proprietà osservate (nessuna chiamata IPC)"""
         stats = {}
         
-        bitrate = self.ipc_client.get_property("audio-bitrate")
+        bitrate = self._properties.get("audio-bitrate")
         if bitrate:
             stats['bitrate'] = f"{int(bitrate/1000)} kbps"
         
-        codec = self.ipc_client.get_property("audio-codec-name")
+        codec = self._properties.get("audio-codec-name")
         if codec:
             stats['codec'] = codec.upper()
         
-        cache = self.ipc_client.get_property("demuxer-cache-duration")
+        cache = self._properties.get("demuxer-cache-duration")
         if cache:
             stats['cache'] = f"{cache:.1f}s"
         
-        buffering = self.ipc_client.get_property("paused-for-cache")
-        if buffering:
+        if self._properties.get("paused-for-cache"):
             stats['buffer_status'] = "BUFFERING"
         else:
-            cache_percent = self.ipc_client.get_property("cache-buffering-state")
+            cache_percent = self._properties.get("cache-buffering-state")
             if cache_percent is not None:
                 stats['buffer_status'] = f"{cache_percent}%"
             else:
@@ -773,14 +1101,17 @@ class MPVController:
 # RADIO PLAYER PRINCIPALE
 # ============================================================================
 
+# Caratteri rimossi dal nome stazione nei file di registrazione
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\s-]')
+
 class RadioPlayer:
     """Radio Player principale con gestione avanzata"""
     
-    def __init__(self, use_rich: bool = RICH_AVAILABLE):
+    def __init__(self, use_rich: bool = RICH_AVAILABLE, max_fps: float = 10):
         self.use_rich = use_rich and RICH_AVAILABLE
         
         # Configurazione socket
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             socket_path = r"\\.\pipe\radio_player_mpv"
         else:
             socket_path = "/tmp/radio_player_mpv.sock"
@@ -788,8 +1119,7 @@ class RadioPlayer:
         # Componenti
         self.stations: List[RadioStation] = []
         self.state = PlayerState()
-        self.mpv_controller = MPVController(socket_path)
-        self.metadata_monitor = MetadataMonitor(self._on_metadata_update)
+        self.mpv_controller = MPVController(socket_path, self._on_mpv_property)
         self.history = MetadataHistory()
         
         # Thread pool
@@ -799,7 +1129,24 @@ class RadioPlayer:
         # UI
         self.running = True
         self.pending_updates = UpdateFlags.FULL
-        
+        # I flag arrivano da più thread (input, IPC, worker): OR e lettura+azzeramento
+        # sotto lock, altrimenti un flag segnato durante lo scambio andrebbe perso
+        self._dirty_lock = threading.Lock()
+        # Segnala al loop principale che ci sono aggiornamenti da disegnare
+        self._wake = threading.Event()
+
+        # Selector input (stdin + self-pipe per risvegliare il thread input)
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        self._old_sigwinch = None  # handler SIGWINCH da ripristinare all'uscita
+        self._input_future: Optional[Future] = None
+        # Tasti già letti da stdin ma non ancora consegnati a handle_input
+        self._key_buffer: deque = deque()
+        # Windows: tasti letti da un thread bloccato su getwch()
+        self._key_queue: Optional[queue.Queue] = None
+        self._stdin_decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+
         # Rich UI
         if self.use_rich:
             self.console = Console()
@@ -812,6 +1159,23 @@ class RadioPlayer:
         self.number_input_mode = False
         self.number_buffer = ""
         
+        # Notifiche: notify-send risolto una sola volta (None = non disponibile)
+        self._notify_send = shutil.which('notify-send') if not IS_WINDOWS else None
+        self._toaster = self._create_toaster() if IS_WINDOWS else None
+        # Coda limitata verso un unico worker: le notifiche non bloccano il
+        # thread IPC e un flood di metadata non accumula processi
+        self._popup_queue: queue.Queue = queue.Queue(maxsize=4)
+        threading.Thread(
+            target=self._popup_worker, name="RadioPlayer-popup", daemon=True
+        ).start()
+        
+        # Volume: un worker invia a MPV solo l'ultimo valore richiesto, così
+        # tenere premuto +/- non accoda una richiesta IPC per ogni tasto
+        self._volume_event = threading.Event()
+        threading.Thread(
+            target=self._volume_worker, name="RadioPlayer-volume", daemon=True
+        ).start()
+        
         # Recording
         self.is_recording = False
         self.recording_process: Optional[subprocess.Popen] = None
@@ -831,17 +1195,34 @@ class RadioPlayer:
         self.search_results: List[RadioStation] = []
         self.search_selected_idx = 0
         self.search_loading = False
-        self._search_timer: Optional[threading.Timer] = None
+        # Debounce ricerca: un unico worker attende la pausa nella digitazione,
+        # invece di un threading.Timer (un thread) per ogni tasto premuto
+        self._search_event = threading.Event()
+        threading.Thread(
+            target=self._search_worker, name="RadioPlayer-search", daemon=True
+        ).start()
         self._last_searched_query = ""   # query dell'ultima ricerca completata
         self._preview_station: Optional[RadioStation] = None  # in ascolto ma non in M3U
         self.m3u_file_path: Optional[Path] = None
 
         # Timer sessione: non si resetta al cambio stazione
-        self.session_start_time = time.time()
+        self.session_start_time = time.monotonic()
         
         # Cache UI
         self.last_render_time = 0
-        self.min_render_interval = 0.1  # Max 10 FPS
+        self.min_render_interval = 1.0 / max_fps  # Default max 10 FPS
+        self._main_layout = None  # layout Rich persistente (vista principale)
+        self._last_tui_line = ""
+        self._controls_panel = None  # pannello controlli statico (senza input numero)
+        self._stations_panel = None
+        self._stations_key: Optional[Tuple] = None  # stato che ha generato _stations_panel
+        self._header_panel = None
+        self._header_key: Optional[Tuple] = None  # valori mostrati in _header_panel
+        self._clock_second = -1  # secondo di orologio a cui si riferisce _clock_text
+        self._clock_text = ""
+        self._status_panel = None
+        self._status_text = None  # markup che ha generato _status_panel
+        self._drawn: Dict[str, Any] = {}  # pannello attualmente in ogni regione del layout
         
         logger.info(f"Inizializzato RadioPlayer (Rich UI: {self.use_rich})")
         
@@ -880,13 +1261,25 @@ class RadioPlayer:
 
             self.m3u_file_path = file_path
             logger.info(f"Caricate {len(self.stations)} stazioni da {file_path}")
-            self.pending_updates |= UpdateFlags.FULL
+            self._mark_dirty(UpdateFlags.FULL)
             return True
             
         except Exception as e:
             logger.error(f"Errore caricamento M3U: {e}", exc_info=True)
             return False
     
+    def _mark_dirty(self, flags: UpdateFlags):
+        """Segna parti dell'UI da ridisegnare e risveglia il loop principale"""
+        with self._dirty_lock:
+            self.pending_updates |= flags
+        self._wake.set()
+
+    def _take_updates(self) -> UpdateFlags:
+        """Restituisce i flag pendenti e li azzera in un unico passo"""
+        with self._dirty_lock:
+            flags, self.pending_updates = self.pending_updates, UpdateFlags.NONE
+        return flags
+
     def _on_metadata_update(self, key: str, value: str):
         """Callback per aggiornamenti metadata"""
         # RIMOSSO DEBUG SU FILE
@@ -909,7 +1302,7 @@ class RadioPlayer:
                     pause_start_time=self.state.stream_info.pause_start_time,
                     total_pause_time=self.state.stream_info.total_pause_time
                 )
-                self.pending_updates |= UpdateFlags.SONG
+                self._mark_dirty(UpdateFlags.SONG)
         
         elif key == 'stream_title':
             old_title = self.state.stream_info.title
@@ -935,8 +1328,10 @@ class RadioPlayer:
                         buffer_status=self.state.stream_info.buffer_status,
                         cache_duration=self.state.stream_info.cache_duration,
                         start_time=self.state.stream_info.start_time,
-                        song_start_time=time.time(),
-                        pause_start_time=None,
+                        song_start_time=time.monotonic(),
+                        # In pausa MPV continua lo stream (muto): il brano nuovo
+                        # parte già in pausa
+                        pause_start_time=time.monotonic() if self.state.is_paused else None,
                         total_pause_time=0.0
                     )
                     
@@ -947,12 +1342,12 @@ class RadioPlayer:
                     
                     # Mostra popup se abilitato
                     if self.state.show_song_popups and old_title:
-                        self._show_notification(f"{artist} - {song}")
+                        self._queue_notification(f"{artist} - {song}")
                     
                     # Mostra anche messaggio temporaneo in UI
                     self.show_temp_message(f"🎵 {artist} - {song}")
                     
-                    self.pending_updates |= UpdateFlags.SONG | UpdateFlags.STATUS
+                    self._mark_dirty(UpdateFlags.SONG | UpdateFlags.STATUS)
                     logger.info(f"Nuovo brano: {artist} - {song}")
             else:
                 if value != self.state.stream_info.song:
@@ -967,8 +1362,10 @@ class RadioPlayer:
                         buffer_status=self.state.stream_info.buffer_status,
                         cache_duration=self.state.stream_info.cache_duration,
                         start_time=self.state.stream_info.start_time,
-                        song_start_time=time.time(),
-                        pause_start_time=None,
+                        song_start_time=time.monotonic(),
+                        # In pausa MPV continua lo stream (muto): il brano nuovo
+                        # parte già in pausa
+                        pause_start_time=time.monotonic() if self.state.is_paused else None,
                         total_pause_time=0.0
                     )
                     
@@ -977,33 +1374,109 @@ class RadioPlayer:
                         self.history.add("", value, station_name)
                     
                     if self.state.show_song_popups and old_title:
-                        self._show_notification(value)
+                        self._queue_notification(value)
                     
                     # Mostra anche messaggio temporaneo in UI
                     self.show_temp_message(f"🎵 {value}")
                     
-                    self.pending_updates |= UpdateFlags.SONG | UpdateFlags.STATUS
+                    self._mark_dirty(UpdateFlags.SONG | UpdateFlags.STATUS)
                     logger.info(f"Nuovo brano: {value}")
     
+    def _on_mpv_property(self, name: str, value: Any):
+        """Callback property-change da MPV (thread lettore IPC: niente IPC qui)"""
+        if name == "metadata":
+            if not isinstance(value, dict):
+                return
+            
+            # Bitrate dichiarato dal server (header ICY esposto da MPV)
+            icy_bitrate = value.get("icy-br")
+            if icy_bitrate:
+                self._on_metadata_update('bitrate', f"{icy_bitrate} kbps")
+            
+            # Cerca il titolo in ordine di specificità
+            # 1. icy-title (standard per radio stream)
+            # 2. title (standard generico)
+            # 3. TITLE (variante)
+            current_title = value.get("icy-title") or value.get("title") or value.get("TITLE")
+            if current_title:
+                current_title = str(current_title).strip()
+                if current_title and current_title != self.state.stream_info.title:
+                    self._on_metadata_update('stream_title', current_title)
+        else:
+            self._apply_audio_stats(self.mpv_controller.get_observed_stats())
+    
+    def _apply_audio_stats(self, stats: Dict[str, Any]):
+        """Riporta le statistiche audio di MPV nello StreamInfo corrente"""
+        if stats.get('bitrate'):
+            self.state.stream_info.audio_bitrate = stats['bitrate']
+        
+        if stats.get('codec'):
+            self.state.stream_info.codec = stats['codec']
+        
+        if stats.get('cache'):
+            self.state.stream_info.cache_duration = stats['cache']
+        
+        if stats.get('buffer_status'):
+            old_buffer = self.state.stream_info.buffer_status
+            self.state.stream_info.buffer_status = stats['buffer_status']
+            
+            # Solo l'ingresso/uscita da BUFFERING forza update immediato
+            if (stats['buffer_status'] == "BUFFERING") != (old_buffer == "BUFFERING"):
+                self._mark_dirty(UpdateFlags.TECHNICAL)
+    
+    def _queue_notification(self, message: str):
+        """Accoda una notifica; con coda piena scarta la più vecchia"""
+        while True:
+            try:
+                self._popup_queue.put_nowait(message)
+                return
+            except queue.Full:
+                try:
+                    self._popup_queue.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def _popup_worker(self):
+        """Worker notifiche: mostra l'ultimo messaggio di ogni raffica"""
+        while True:
+            message = self._popup_queue.get()
+            # Debounce: cambi di titolo ravvicinati (es. titolo provvisorio
+            # seguito da quello definitivo) producono una sola notifica
+            time.sleep(0.5)
+            while True:
+                try:
+                    message = self._popup_queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._show_notification(message)
+    
+    @staticmethod
+    def _create_toaster() -> Optional[Any]:
+        """ToastNotifier Windows creato una volta (None se win10toast manca)"""
+        try:
+            from win10toast import ToastNotifier
+            return ToastNotifier()
+        except Exception as e:
+            logger.debug(f"Notifiche Windows non disponibili: {e}")
+            return None
+    
     def _show_notification(self, message: str):
         """Mostra notifica di sistema"""
         if not self.state.show_song_popups:
             return
         
         try:
-            if platform.system() == "Windows":
-                # Windows notification
-                try:
-                    from win10toast import ToastNotifier
-                    toaster = ToastNotifier()
-                    toaster.show_toast("🎵 Radio Player", message, 
-                                     icon_path=None, duration=4, threaded=True)
-                except ImportError:
-                    pass
-            else:
+            if self._toaster:
+                # Windows notification: non threaded, il worker è già fuori dal
+                # thread UI. Con threaded=True il ToastNotifier condiviso scarta
+                # (return False) ogni toast mentre il precedente è ancora visibile;
+                # così i titoli arrivati nel frattempo restano in coda
+                self._toaster.show_toast("🎵 Radio Player", message, 
+                                         icon_path=None, duration=4, threaded=False)
+            elif self._notify_send:
                 # Linux notification
                 subprocess.run(
-                    ['notify-send', '🎵 Radio Player', message,
+                    [self._notify_send, '🎵 Radio Player', message,
                      '--icon=audio-x-generic', '--expire-time=4000'],
                     check=True, capture_output=True, timeout=2
                 )
@@ -1021,28 +1494,27 @@ class RadioPlayer:
         # Stop precedente
         self.stop()
         
-        # Avvia MPV
-        if self.mpv_controller.start(station.url, self.state.volume):
+        # Stato pronto prima dell'avvio: observe_property invia i primi
+        # metadata già durante la connessione IPC
+        self.state.playing_station_index = self.state.selected_station_index
+        # NON inizializzo più con "Caricamento..." - lascio vuoto
+        self.state.stream_info = StreamInfo(
+            start_time=time.monotonic(),
+            song_start_time=time.monotonic()
+        )
+        
+        # Avvia MPV (metadata e statistiche arrivano via observe_property)
+        if self.mpv_controller.start(station.url, self.state.volume, self.state.is_muted):
             self.state.is_playing = True
             self.state.is_paused = False
-            self.state.playing_station_index = self.state.selected_station_index
-            # NON inizializzo più con "Caricamento..." - lascio vuoto
-            self.state.stream_info = StreamInfo(
-                start_time=time.time(),
-                song_start_time=time.time()
-            )
-            
-            # Avvia monitor metadata in thread pool
-            self.metadata_monitor.start(station.url)
-            self.executor.submit(self.metadata_monitor.monitor_loop)
-            
-            # Avvia monitor stats
-            self.executor.submit(self._stats_monitor_loop)
             
-            self.pending_updates |= UpdateFlags.STATUS | UpdateFlags.SONG | UpdateFlags.STATIONS
+            self._mark_dirty(UpdateFlags.STATUS | UpdateFlags.SONG | UpdateFlags.STATIONS)
             
             logger.info("Riproduzione avviata")
         else:
+            self.state.playing_station_index = -1
+            self.state.stream_info = StreamInfo()
+            self._mark_dirty(UpdateFlags.STATIONS)
             logger.error("Impossibile avviare riproduzione")
     
     def stop(self):
@@ -1054,7 +1526,6 @@ class RadioPlayer:
             if self.is_recording:
                 self.stop_recording()
             
-            self.metadata_monitor.stop()
             self.mpv_controller.stop()
             
             self.state.is_playing = False
@@ -1063,7 +1534,7 @@ class RadioPlayer:
             self.state.stream_info = StreamInfo()
             self._preview_station = None
 
-            self.pending_updates |= UpdateFlags.STATUS | UpdateFlags.SONG | UpdateFlags.STATIONS
+            self._mark_dirty(UpdateFlags.STATUS | UpdateFlags.SONG | UpdateFlags.STATIONS)
     
     def toggle_play_pause(self):
         """Toggle play/pause"""
@@ -1082,15 +1553,19 @@ class RadioPlayer:
                 if self.state.is_paused:
                     # Era in pausa -> riprendi
                     self.state.is_paused = False
-                    self.state.stream_info.total_pause_time += time.time() - self.state.stream_info.pause_start_time
-                    self.state.stream_info.pause_start_time = None
-                    self.pending_updates |= UpdateFlags.STATUS | UpdateFlags.SONG
+                    info = self.state.stream_info
+                    if info.pause_start_time is not None:
+                        info.total_pause_time += time.monotonic() - info.pause_start_time
+                        info.pause_start_time = None
+                    self._sync_mute()
+                    self._mark_dirty(UpdateFlags.STATUS | UpdateFlags.SONG | UpdateFlags.STATIONS)
                     logger.info("Riproduzione ripresa")
                 else:
                     # Era in play -> pausa
                     self.state.is_paused = True
-                    self.state.stream_info.pause_start_time = time.time()
-                    self.pending_updates |= UpdateFlags.STATUS | UpdateFlags.SONG
+                    self.state.stream_info.pause_start_time = time.monotonic()
+                    self._sync_mute()
+                    self._mark_dirty(UpdateFlags.STATUS | UpdateFlags.SONG | UpdateFlags.STATIONS)
                     logger.info("Riproduzione in pausa")
     
     def change_volume(self, delta: int):
@@ -1098,21 +1573,33 @@ class RadioPlayer:
         self.state.volume = max(0, min(100, self.state.volume + delta))
         
         if self.state.is_playing:
-            self.mpv_controller.set_volume(self.state.volume)
+            self._volume_event.set()
         
-        self.pending_updates |= UpdateFlags.TIMER
+        self._mark_dirty(UpdateFlags.TIMER)
         logger.debug(f"Volume: {self.state.volume}%")
     
+    def _volume_worker(self):
+        """Worker volume: invia il valore corrente, al massimo ogni 20 ms"""
+        while True:
+            self._volume_event.wait()
+            self._volume_event.clear()
+            if self.state.is_playing:
+                self.mpv_controller.set_volume(self.state.volume)
+            time.sleep(0.02)
+    
     def toggle_mute(self):
         """Toggle muto"""
         self.state.is_muted = not self.state.is_muted
+        self._sync_mute()
         
-        if self.state.is_playing:
-            self.mpv_controller.set_mute(self.state.is_muted)
-        
-        self.pending_updates |= UpdateFlags.TIMER
+        self._mark_dirty(UpdateFlags.TIMER)
         logger.debug(f"Muto: {self.state.is_muted}")
     
+    def _sync_mute(self):
+        """Allinea il muto di MPV: lo stream resta silenziato in pausa o con muto attivo"""
+        if self.state.is_playing:
+            self.mpv_controller.set_mute(self.state.is_paused or self.state.is_muted)
+    
     def change_selection(self, delta: int):
         """Cambia stazione selezionata"""
         if not self.stations:
@@ -1122,19 +1609,19 @@ class RadioPlayer:
             self.state.selected_station_index + delta
         ) % len(self.stations)
         
-        self.pending_updates |= UpdateFlags.STATIONS
+        self._mark_dirty(UpdateFlags.STATIONS)
     
     def select_by_number(self, number: int):
         """Seleziona stazione per numero"""
         if 1 <= number <= len(self.stations):
             self.state.selected_station_index = number - 1
-            self.pending_updates |= UpdateFlags.STATIONS
+            self._mark_dirty(UpdateFlags.STATIONS)
             logger.debug(f"Selezionata stazione #{number}")
     
     def toggle_notifications(self):
         """Toggle notifiche cambio brano"""
         self.state.show_song_popups = not self.state.show_song_popups
-        self.pending_updates |= UpdateFlags.TIMER
+        self._mark_dirty(UpdateFlags.TIMER)
         
         status = "ON" if self.state.show_song_popups else "OFF"
         self.show_temp_message(f"🔔 Notifiche: {status}")
@@ -1177,7 +1664,7 @@ class RadioPlayer:
         
         status = "ON" if self.logging_enabled else "OFF"
         self.show_temp_message(f"📝 Logging: {status}")
-        self.pending_updates |= UpdateFlags.TIMER
+        self._mark_dirty(UpdateFlags.TIMER)
     
     def toggle_recording(self):
         """Toggle registrazione stream"""
@@ -1199,7 +1686,7 @@ class RadioPlayer:
         
         station = self.stations[self.state.playing_station_index]
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        station_name = re.sub(r'[^\w\s-]', '', station.name)[:30]
+        station_name = _UNSAFE_FILENAME_RE.sub('', station.name)[:30]
         
         self.recording_file = Path(f"recording_{station_name}_{timestamp}.mp3")
         
@@ -1220,7 +1707,7 @@ class RadioPlayer:
             )
             
             self.is_recording = True
-            self.pending_updates |= UpdateFlags.STATUS
+            self._mark_dirty(UpdateFlags.STATUS)
             self.show_temp_message(f"🔴 Registrazione avviata: {self.recording_file.name}")
             logger.info(f"Registrazione avviata: {self.recording_file}")
             
@@ -1243,7 +1730,7 @@ class RadioPlayer:
                 self.recording_process = None
             
             self.is_recording = False
-            self.pending_updates |= UpdateFlags.STATUS
+            self._mark_dirty(UpdateFlags.STATUS)
             
             if self.recording_file and self.recording_file.exists():
                 size_mb = self.recording_file.stat().st_size / (1024 * 1024)
@@ -1261,8 +1748,8 @@ class RadioPlayer:
     def show_temp_message(self, message: str):
         """Mostra messaggio temporaneo nell'UI"""
         self.temp_message = message
-        self.temp_message_time = time.time()
-        self.pending_updates |= UpdateFlags.STATUS
+        self.temp_message_time = time.monotonic()
+        self._mark_dirty(UpdateFlags.STATUS)
     
     def show_history(self):
         """Mostra cronologia ultimi brani"""
@@ -1299,36 +1786,41 @@ class RadioPlayer:
         self.search_results = []
         self.search_selected_idx = 0
         self.search_loading = False
-        self.pending_updates |= UpdateFlags.FULL
+        self._mark_dirty(UpdateFlags.FULL)
         logger.info("Entrato in modalità ricerca RadioBrowser")
 
     def exit_search_mode(self):
         """Esce dalla modalità ricerca"""
-        if self._search_timer:
-            self._search_timer.cancel()
-            self._search_timer = None
+        self._search_event.clear()
         self.search_mode = False
-        self.pending_updates |= UpdateFlags.FULL
+        self._mark_dirty(UpdateFlags.FULL)
         logger.info("Uscito dalla modalità ricerca")
 
     def _trigger_search(self):
-        """Avvia ricerca con debounce di 0.5s"""
-        if self._search_timer:
-            self._search_timer.cancel()
-            self._search_timer = None
-
+        """Avvia ricerca con debounce di 0.3s"""
         if not self.search_query.strip():
+            self._search_event.clear()
             self.search_results = []
             self.search_selected_idx = 0
             self.search_loading = False
-            self.pending_updates |= UpdateFlags.STATIONS
+            self._mark_dirty(UpdateFlags.STATIONS)
             return
 
         self.search_loading = True
-        self.pending_updates |= UpdateFlags.STATIONS
-        self._search_timer = threading.Timer(0.3, self._do_search)
-        self._search_timer.daemon = True
-        self._search_timer.start()
+        self._mark_dirty(UpdateFlags.STATIONS)
+        self._search_event.set()
+
+    def _search_worker(self):
+        """Worker ricerca: parte 0.3s dopo l'ultimo tasto della raffica"""
+        while True:
+            self._search_event.wait()
+            while True:
+                self._search_event.clear()
+                if not self._search_event.wait(0.3):
+                    break
+            # Uscita dalla ricerca o query svuotata durante l'attesa
+            if self.search_mode and self.search_loading:
+                self._do_search()
 
     def _do_search(self):
         """Esegue la chiamata API in background"""
@@ -1342,32 +1834,31 @@ class RadioPlayer:
                 self.search_selected_idx = 0
                 self.search_loading = False
                 self._last_searched_query = query  # memorizza per il messaggio "nessun risultato"
-                self.pending_updates |= UpdateFlags.STATIONS
+                self._mark_dirty(UpdateFlags.STATIONS)
         except Exception as e:
             logger.error(f"Errore ricerca: {e}")
-            self.search_loading = False
-            self._last_searched_query = query
-            self.pending_updates |= UpdateFlags.STATIONS
+            if query == self.search_query:  # altrimenti la query nuova resta in attesa
+                self.search_loading = False
+                self._last_searched_query = query
+                self._mark_dirty(UpdateFlags.STATIONS)
 
     def play_preview(self, station: RadioStation):
         """Ascolta anteprima senza aggiungere al M3U"""
         self.stop()
-        if self.mpv_controller.start(station.url, self.state.volume):
+        self._preview_station = station
+        self.state.stream_info = StreamInfo(
+            start_time=time.monotonic(),
+            song_start_time=time.monotonic(),
+        )
+        if self.mpv_controller.start(station.url, self.state.volume, self.state.is_muted):
             self.state.is_playing = True
             self.state.is_paused = False
-            self.state.playing_station_index = -1
-            self._preview_station = station
-            self.state.stream_info = StreamInfo(
-                start_time=time.time(),
-                song_start_time=time.time(),
-            )
-            self.metadata_monitor.start(station.url)
-            self.executor.submit(self.metadata_monitor.monitor_loop)
-            self.executor.submit(self._stats_monitor_loop)
-            self.pending_updates |= UpdateFlags.STATUS | UpdateFlags.SONG
+            self._mark_dirty(UpdateFlags.STATUS | UpdateFlags.SONG | UpdateFlags.STATIONS)
             self.show_temp_message(f"👂 Anteprima: {station.name}")
             logger.info(f"Preview: {station.name}")
         else:
+            self._preview_station = None
+            self.state.stream_info = StreamInfo()
             self.show_temp_message("❌ Impossibile avviare anteprima")
 
     def add_station_to_m3u(self, station: RadioStation) -> bool:
@@ -1402,7 +1893,7 @@ class RadioPlayer:
                 f.write(f"#EXTINF:-1,{station.name}\n{station.url}\n")
 
             self.stations.append(station)
-            self.pending_updates |= UpdateFlags.STATIONS
+            self._mark_dirty(UpdateFlags.STATIONS)
             self.show_temp_message(f"✅ Aggiunta: {station.name}")
             logger.info(f"Aggiunta al M3U: {station.name} — {station.url}")
             return True
@@ -1411,69 +1902,6 @@ class RadioPlayer:
             self.show_temp_message(f"❌ Errore salvataggio: {e}")
             logger.error(f"Errore aggiunta stazione: {e}")
             return False
-
-    def _stats_monitor_loop(self):
-        """Loop monitoraggio statistiche MPV e METADATA"""
-        logger.info("Avviato monitor statistiche")
-        
-        while self.state.is_playing and self.mpv_controller.is_running():
-            try:
-                # Controlla pausa e muta/unmuta MPV
-                if self.state.is_paused:
-                    # In pausa -> muta
-                    self.mpv_controller.set_mute(True)
-                elif self.state.is_muted:
-                    # Muto esplicito
-                    self.mpv_controller.set_mute(True)
-                else:
-                    # Unmuta
-                    self.mpv_controller.set_mute(False)
-                
-                stats = self.mpv_controller.get_audio_stats()
-                
-                if stats.get('bitrate'):
-                    self.state.stream_info.audio_bitrate = stats['bitrate']
-                
-                if stats.get('codec'):
-                    self.state.stream_info.codec = stats['codec']
-                
-                if stats.get('cache'):
-                    self.state.stream_info.cache_duration = stats['cache']
-                
-                if stats.get('buffer_status'):
-                    old_buffer = self.state.stream_info.buffer_status
-                    self.state.stream_info.buffer_status = stats['buffer_status']
-                    
-                    # Solo BUFFERING forza update immediato
-                    if stats['buffer_status'] == "BUFFERING" and old_buffer != "BUFFERING":
-                        self.pending_updates |= UpdateFlags.TECHNICAL
-                
-                # FALLBACK: Recupera metadata completo da MPV
-                # Questo è fondamentale per stream Shoutcast/Icecast
-                metadata = self.mpv_controller.ipc_client.get_property("metadata")
-                
-                if metadata and isinstance(metadata, dict):
-                    # Cerca il titolo in ordine di specificità
-                    # 1. icy-title (standard per radio stream)
-                    # 2. title (standard generico)
-                    # 3. TITLE (variante)
-                    current_title = metadata.get("icy-title") or metadata.get("title") or metadata.get("TITLE")
-                    
-                    if current_title:
-                        # Se il titolo è diverso da quello attuale, aggiornalo
-                        # Nota: normalizziamo eventuali spazi
-                        current_title = str(current_title).strip()
-                        if current_title and current_title != self.state.stream_info.title:
-                            # Usa la stessa logica di callback per parsing e UI update
-                            self._on_metadata_update('stream_title', current_title)
-                
-                time.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Errore monitor stats: {e}")
-                break
-        
-        logger.info("Terminato monitor statistiche")
     
     # ========================================================================
     # UI RICH
@@ -1496,15 +1924,20 @@ class RadioPlayer:
 
         return layout
     
-    def _render_rich_header(self) -> Optional[Any]:
+    def _render_rich_header(self, now: Optional[float] = None) -> Optional[Any]:
         """Renderizza header Rich"""
         if not RICH_AVAILABLE:
             return None
         
-        current_time = datetime.now().strftime("%H:%M:%S")
+        # Orologio: formattato una sola volta per secondo, senza costruire un datetime
+        wall_second = int(time.time())
+        if wall_second != self._clock_second:
+            self._clock_second = wall_second
+            self._clock_text = time.strftime("%H:%M:%S", time.localtime(wall_second))
+        current_time = self._clock_text
 
         # Uptime di sessione: calcolato da session_start_time, mai resettato
-        elapsed = time.time() - self.session_start_time
+        elapsed = (now or time.monotonic()) - self.session_start_time
         h = int(elapsed // 3600)
         m = int((elapsed % 3600) // 60)
         s = int(elapsed % 60)
@@ -1514,6 +1947,11 @@ class RadioPlayer:
         notif_icon = "🔔" if self.state.show_song_popups else "🔕"
         log_status = "📝 LOG" if self.logging_enabled else "📝 ✗"
         
+        # Contenuto identico al frame precedente: stesso pannello
+        key = (current_time, uptime, volume_icon, self.state.volume, log_status, notif_icon)
+        if key == self._header_key:
+            return self._header_panel
+        
         header_text = Text()
         header_text.append("🎵 RADIO PLAYER M3U", style="bold cyan")
         header_text.append(f"    ⏰ {current_time}", style="white")
@@ -1524,13 +1962,16 @@ class RadioPlayer:
         # -----------------------------------------------
         header_text.append(f"    {notif_icon}", style="blue")
         
-        return Panel(header_text, border_style="cyan")
+        self._header_panel = Panel(header_text, border_style="cyan")
+        self._header_key = key
+        return self._header_panel
     
-    def _render_rich_status(self) -> Optional[Any]:
+    def _render_rich_status(self, now: Optional[float] = None) -> Optional[Any]:
         """Renderizza status Rich (3 righe di contenuto, size=5)"""
         if not RICH_AVAILABLE:
             return None
 
+        now = now or time.monotonic()
         si = self.state.stream_info
 
         # Riga 1: stato + stazione + registrazione
@@ -1553,12 +1994,12 @@ class RadioPlayer:
 
         # Riga 2: info brano
         if si.artist and si.song:
-            song_time = si.get_song_time(self.state.is_playing, self.state.is_paused)
+            song_time = si.get_song_time(self.state.is_playing, self.state.is_paused, now)
             time_str = f" [yellow][{song_time}][/yellow]" if song_time != "00:00" else ""
             line2 = f"[magenta]🎤 {si.artist}[/magenta]  [bold blue]🎼 {si.song}[/bold blue]{time_str}"
         elif si.song or si.title:
             song = si.song or si.title
-            song_time = si.get_song_time(self.state.is_playing, self.state.is_paused)
+            song_time = si.get_song_time(self.state.is_playing, self.state.is_paused, now)
             time_str = f" [yellow][{song_time}][/yellow]" if song_time != "00:00" else ""
             line2 = f"[bold blue]🎼 {song}[/bold blue]{time_str}"
         elif self.state.is_playing:
@@ -1567,7 +2008,7 @@ class RadioPlayer:
             line2 = ""
 
         # Riga 3: messaggio temporaneo oppure info tecniche
-        if self.temp_message and (time.time() - self.temp_message_time) < 2:
+        if self.temp_message and (now - self.temp_message_time) < 2:
             line3 = f"[yellow]💬 {self.temp_message}[/yellow]"
         else:
             tech = []
@@ -1588,7 +2029,12 @@ class RadioPlayer:
         if line3:
             parts.append(line3)
 
-        return Panel("\n".join(parts), title="Status", border_style="green")
+        # Stesso testo del frame precedente (es. in pausa): stesso pannello
+        text = "\n".join(parts)
+        if text != self._status_text:
+            self._status_panel = Panel(text, title="Status", border_style="green")
+            self._status_text = text
+        return self._status_panel
     
     def _render_rich_stations(self) -> Optional[Any]:
         """Renderizza lista stazioni Rich (sempre 10 righe, size=12)"""
@@ -1604,6 +2050,14 @@ class RadioPlayer:
             start_idx = max(0, n_stations - n_visible)
         end_idx = min(n_stations, start_idx + n_visible)
 
+        # La finestra cambia solo con selezione, stazione in play o lista:
+        # altrimenti si riusa il pannello già costruito
+        key = (start_idx, end_idx, n_stations,
+               self.state.selected_station_index, self.state.playing_station_index,
+               self.state.is_playing, self.state.is_paused)
+        if key == self._stations_key:
+            return self._stations_panel
+
         table = Table(show_header=False, box=None, padding=(0, 1))
         table.add_column("Marker", style="cyan", width=4, no_wrap=True)
         table.add_column("Number", style="yellow", width=3, no_wrap=True)
@@ -1626,35 +2080,44 @@ class RadioPlayer:
         if n_stations > n_visible:
             title += f"  [{start_idx + 1}–{end_idx} di {n_stations}]"
 
-        return Panel(table, title=title, border_style="blue")
-    
+        self._stations_panel = Panel(table, title=title, border_style="blue")
+        self._stations_key = key
+        return self._stations_panel
+    
+    # Righe comandi della vista principale (testo statico)
+    CONTROL_LINES = (
+        "[cyan]↑/↓[/cyan] Seleziona  "
+        "[cyan]p/Space[/cyan] Play/Pausa  "
+        "[cyan]+/=[/cyan] Vol+  "
+        "[cyan]-/_[/cyan] Vol-  "
+        "[cyan]m[/cyan] Muto  "
+        "[cyan]b[/cyan] Sfoglia RadioBrowser",
+
+        "[cyan]r[/cyan] Rec  "
+        "[cyan]l[/cyan] Log  "
+        "[cyan]t[/cyan] Notifiche  "
+        "[cyan]h[/cyan] Cronologia  "
+        "[cyan]s[/cyan] Salva  "
+        "[cyan]1-9+↵[/cyan] Vai a #  "
+        "[cyan]q[/cyan] Esci",
+    )
+
     def _render_rich_controls(self) -> Optional[Any]:
         """Renderizza controlli Rich (2 righe compatte + eventuale input numero)"""
         if not RICH_AVAILABLE:
             return None
 
-        lines = [
-            "[cyan]↑/↓[/cyan] Seleziona  "
-            "[cyan]p/Space[/cyan] Play/Pausa  "
-            "[cyan]+/=[/cyan] Vol+  "
-            "[cyan]-/_[/cyan] Vol-  "
-            "[cyan]m[/cyan] Muto  "
-            "[cyan]b[/cyan] Sfoglia RadioBrowser",
-
-            "[cyan]r[/cyan] Rec  "
-            "[cyan]l[/cyan] Log  "
-            "[cyan]t[/cyan] Notifiche  "
-            "[cyan]h[/cyan] Cronologia  "
-            "[cyan]s[/cyan] Salva  "
-            "[cyan]1-9+↵[/cyan] Vai a #  "
-            "[cyan]q[/cyan] Esci",
-        ]
+        if not self.number_input_mode:
+            if self._controls_panel is None:
+                self._controls_panel = Panel("\n".join(self.CONTROL_LINES),
+                                             title="🎮 Controlli", border_style="yellow")
+            return self._controls_panel
 
-        if self.number_input_mode:
-            lines.append(
-                f"[bold yellow]🔢 NUMERO: {self.number_buffer}_[/bold yellow]"
-                "  [dim](↵=conferma  Esc=annulla)[/dim]"
-            )
+        lines = list(self.CONTROL_LINES)
+        lines.append(
+            f"[bold yellow]🔢 NUMERO: {self.number_buffer}_[/bold yellow]"
+            "  [dim](↵=conferma  Esc=annulla)[/dim]"
+        )
 
         return Panel("\n".join(lines), title="🎮 Controlli", border_style="yellow")
     
@@ -1682,11 +2145,12 @@ class RadioPlayer:
             Layout(name="search_controls", size=4),
         )
 
-        layout["header"].update(self._render_rich_header())
+        now = time.monotonic()
+        layout["header"].update(self._render_rich_header(now))
 
         # --- Stato corrente: determina titoli e colori ---
-        spinner = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")[int(time.time() * 8) % 10]
-        cursor  = "_" if int(time.time() * 2) % 2 == 0 else " "
+        spinner = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")[int(now * 8) % 10]
+        cursor  = "_" if int(now * 2) % 2 == 0 else " "
 
         if self.search_loading:
             input_title   = f"🔍 RadioBrowser.info  [bold yellow]{spinner} RICERCA IN CORSO...[/bold yellow]"
@@ -1739,10 +2203,13 @@ class RadioPlayer:
                 start = max(0, len(self.search_results) - n_visible)
             end = min(len(self.search_results), start + n_visible)
 
+            # URL già nel M3U, calcolati una volta per frame
+            known_urls = {e.url.rstrip("/") for e in self.stations}
+
             for i in range(start, end):
                 s = self.search_results[i]
                 marker  = "👉" if i == self.search_selected_idx else "  "
-                already = any(e.url.rstrip("/") == s.url.rstrip("/") for e in self.stations)
+                already = s.url.rstrip("/") in known_urls
                 name    = f"[dim]{s.name} ✓[/dim]" if already else s.name
                 country = s.metadata.get("rb-country", "")[:5]
                 bitrate = s.metadata.get("rb-bitrate", "0")
@@ -1772,22 +2239,47 @@ class RadioPlayer:
 
         return layout
 
-    def _render_rich(self) -> Optional[Any]:
-        """Renderizza interfaccia completa Rich"""
+    def _render_rich(self, flags: UpdateFlags = UpdateFlags.FULL) -> Optional[Any]:
+        """Renderizza interfaccia Rich, ricostruendo solo le regioni in flags
+
+        Restituisce None se nessuna delle regioni richieste è cambiata:
+        in quel caso non serve ridisegnare lo schermo.
+        """
         if not RICH_AVAILABLE:
             return None
 
         if self.search_mode:
             return self._render_rich_search()
 
-        layout = self._build_rich_layout()
-
-        layout["header"].update(self._render_rich_header())
-        layout["status"].update(self._render_rich_status())
-        layout["stations"].update(self._render_rich_stations())
-        layout["controls"].update(self._render_rich_controls())
-
-        return layout
+        # Il layout principale è persistente: le regioni non toccate da
+        # flags mantengono il pannello del frame precedente
+        layout = self._main_layout
+        if layout is None:
+            layout = self._main_layout = self._build_rich_layout()
+            flags = UpdateFlags.FULL
+
+        # Un solo istante di riferimento per tutto il frame
+        now = time.monotonic()
+        regions = []
+        if flags & UpdateFlags.TIMER:
+            regions.append(("header", self._render_rich_header(now)))
+        if flags & (UpdateFlags.STATUS | UpdateFlags.SONG | UpdateFlags.TECHNICAL):
+            regions.append(("status", self._render_rich_status(now)))
+        if flags & UpdateFlags.STATIONS:
+            regions.append(("stations", self._render_rich_stations()))
+        if flags & UpdateFlags.INPUT:
+            regions.append(("controls", self._render_rich_controls()))
+
+        # I render memoizzati restituiscono lo stesso oggetto se il contenuto
+        # non cambia; FULL (resize, ritorno dalla ricerca) ridisegna comunque
+        changed = flags == UpdateFlags.FULL
+        for name, panel in regions:
+            if panel is not self._drawn.get(name):
+                layout[name].update(panel)
+                self._drawn[name] = panel
+                changed = True
+
+        return layout if changed else None
     
     # ========================================================================
     # INPUT E LOOP PRINCIPALE
@@ -1795,46 +2287,151 @@ class RadioPlayer:
     
     def setup_terminal(self):
         """Configura terminale per input raw"""
-        if platform.system() != "Windows":
+        if not IS_WINDOWS:
             self.old_settings = termios.tcgetattr(sys.stdin)
             tty.setcbreak(sys.stdin.fileno())
-    
+
+            # Il thread input resta bloccato nel selector finché non arriva
+            # un tasto o un byte sulla self-pipe (resize, uscita)
+            self._wake_r, self._wake_w = os.pipe()
+            # Scrittura non bloccante: una raffica di resize che riempie la
+            # pipe non deve bloccare il thread principale nel signal handler
+            os.set_blocking(self._wake_w, False)
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(sys.stdin.fileno(), selectors.EVENT_READ)
+            self._selector.register(self._wake_r, selectors.EVENT_READ)
+            self._old_sigwinch = signal.signal(signal.SIGWINCH, self._on_resize)
+        else:
+            self._enable_windows_vt()
+
+            # getwch() blocca fino al tasto: gira in un thread daemon che non
+            # trattiene l'uscita, e consegna i tasti tramite coda
+            self._key_queue = queue.Queue()
+            threading.Thread(
+                target=self._windows_key_reader, name="RadioPlayer-keys", daemon=True
+            ).start()
+
+    def _enable_windows_vt(self):
+        """Abilita le sequenze ANSI nella console Windows 10+ (senza avviare cmd.exe)"""
+        ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+        try:
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            mode = ctypes.c_uint32()
+            if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                kernel32.SetConsoleMode(handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING)
+        except Exception as e:
+            logger.debug(f"Modalità VT non attivabile: {e}")
+
     def restore_terminal(self):
         """Ripristina terminale"""
-        if platform.system() != "Windows" and self.old_settings:
+        if IS_WINDOWS:
+            return
+        if self.old_settings:
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
+        
+        if self._selector is not None:
+            signal.signal(signal.SIGWINCH, self._old_sigwinch or signal.SIG_DFL)
+            # Il thread input è già stato risvegliato: si attende che lasci il
+            # selector prima di chiuderlo
+            if self._input_future is not None:
+                wait([self._input_future], timeout=0.5)
+            self._selector.unregister(sys.stdin.fileno())
+            self._selector.unregister(self._wake_r)
+            self._selector.close()
+            self._selector = None
+            
+            wake_r, wake_w = self._wake_r, self._wake_w
+            self._wake_r = self._wake_w = None
+            os.close(wake_r)
+            os.close(wake_w)
+
+    def clear_screen(self):
+        """Pulisce lo schermo con la sequenza ANSI (senza avviare processi)"""
+        sys.stdout.write(_CLEAR_SEQ)
+        sys.stdout.flush()
+
+    def _on_resize(self, signum, frame):
+        """Handler SIGWINCH: delega il ridisegno al thread input via self-pipe"""
+        self._wake_input(b'r')
+
+    def _windows_key_reader(self):
+        """Thread lettore tastiera Windows: getwch() bloccante, frecce tradotte"""
+        while self.running:
+            char = msvcrt.getwch()
+            # '\xe0' è anche 'à' (tasto proprio sulle tastiere italiane): è un
+            # prefisso di tasto esteso solo se il secondo codice è già in attesa
+            if char in ('\x00', '\xe0') and msvcrt.kbhit():
+                # Tasto esteso: il secondo carattere identifica la freccia
+                key = {'H': 'UP', 'P': 'DOWN', 'M': 'RIGHT', 'K': 'LEFT'}.get(msvcrt.getwch())
+                if key:
+                    self._key_queue.put(key)
+            else:
+                self._key_queue.put('ESC' if char == '\x1b' else char)
     
+    def _wake_input(self, token: bytes = b'x'):
+        """Risveglia il thread input bloccato nel selector"""
+        if self._key_queue is not None:
+            self._key_queue.put(None)
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, token)
+            except OSError:  # incluso BlockingIOError: pipe piena, risveglio già in coda
+                pass
+
     def get_char(self) -> Optional[str]:
-        """Legge carattere da stdin (non bloccante)"""
-        if platform.system() == "Windows":
-            if msvcrt.kbhit():
-                char = msvcrt.getch().decode('utf-8', errors='ignore')
-                if char == '\xe0':
-                    char = msvcrt.getch().decode('utf-8', errors='ignore')
-                    return {'H': 'UP', 'P': 'DOWN', 'M': 'RIGHT', 'K': 'LEFT'}.get(char)
-                return char if char != '\x1b' else 'ESC'
-            return None
+        """Legge un tasto da stdin (bloccante; None se risvegliato senza input)"""
+        if IS_WINDOWS:
+            return self._key_queue.get()
         else:
+            if self._key_buffer:
+                return self._key_buffer.popleft()
+            
             fd = sys.stdin.fileno()
-            # Usa os.read() direttamente: sys.stdin.read(1) chiama internamente
-            # os.read(fd, 8192) e mette [A nel buffer Python; il select() successivo
-            # controlla il fd OS (ora vuoto) e restituisce False → frecce rotte.
-            if not select.select([fd], [], [], 0.05)[0]:
+            # Attesa bloccante: nessun risveglio finché non c'è input o un
+            # segnale sulla self-pipe
+            ready = [key.fd for key, _ in self._selector.select()]
+            if self._wake_r in ready:
+                if b'r' in os.read(self._wake_r, 64):
+                    self._mark_dirty(UpdateFlags.FULL)
+            if fd not in ready:
                 return None
+            # Usa os.read() direttamente (niente buffer di sys.stdin, che il
+            # selector non vede) e legge in un colpo tutti i byte disponibili:
+            # una sequenza freccia arriva con una sola syscall
             try:
-                char = os.read(fd, 1).decode('utf-8', errors='ignore')
+                data = os.read(fd, 64)
+                if data[-1:] == b'\x1b' or data[-2:] in (b'\x1b[', b'\x1bO'):
+                    # Sequenza troncata: attende il resto senza bloccare
+                    if select.select([fd], [], [], 0.05)[0]:
+                        data += os.read(fd, 64)
             except Exception:
                 return None
-            if char == '\x1b':
-                # Controlla se seguono byte di sequenza (frecce) senza bloccare
-                if select.select([fd], [], [], 0.05)[0]:
-                    try:
-                        seq = os.read(fd, 2).decode('utf-8', errors='ignore')
-                        return {'[A': 'UP', '[B': 'DOWN', '[C': 'RIGHT', '[D': 'LEFT'}.get(seq, 'ESC')
-                    except Exception:
-                        pass
-                return 'ESC'
-            return char
+            
+            self._key_buffer.extend(self._split_keys(self._stdin_decoder.decode(data)))
+            return self._key_buffer.popleft() if self._key_buffer else None
+    
+    @staticmethod
+    def _split_keys(text: str) -> List[str]:
+        """Divide l'input letto in tasti, traducendo le sequenze ESC delle frecce"""
+        keys = []
+        i, n = 0, len(text)
+        while i < n:
+            char = text[i]
+            i += 1
+            if char != '\x1b':
+                keys.append(char)
+            elif i < n and text[i] in '[O':
+                # Sequenza CSI/SS3: parametri opzionali + carattere finale
+                j = i + 1
+                while j < n and not ('@' <= text[j] <= '~'):
+                    j += 1
+                seq = text[i + 1:j + 1]
+                i = j + 1
+                keys.append({'A': 'UP', 'B': 'DOWN', 'C': 'RIGHT', 'D': 'LEFT'}.get(seq, 'ESC'))
+            else:
+                keys.append('ESC')
+        return keys
     
     def handle_input(self):
         """Loop gestione input"""
@@ -1852,13 +2449,13 @@ class RadioPlayer:
                     elif char == 'UP':
                         if self.search_results:
                             self.search_selected_idx = max(0, self.search_selected_idx - 1)
-                            self.pending_updates |= UpdateFlags.STATIONS
+                            self._mark_dirty(UpdateFlags.STATIONS)
                     elif char == 'DOWN':
                         if self.search_results:
                             self.search_selected_idx = min(
                                 len(self.search_results) - 1, self.search_selected_idx + 1
                             )
-                            self.pending_updates |= UpdateFlags.STATIONS
+                            self._mark_dirty(UpdateFlags.STATIONS)
                     elif char in ('\r', '\n'):
                         # Aggiungi stazione selezionata al M3U
                         if self.search_results and 0 <= self.search_selected_idx < len(self.search_results):
@@ -1876,34 +2473,35 @@ class RadioPlayer:
                         if self.search_query:
                             self.search_query = self.search_query[:-1]
                             self._trigger_search()
-                            self.pending_updates |= UpdateFlags.STATUS
+                            self._mark_dirty(UpdateFlags.STATUS)
                     elif len(char) == 1 and char.isprintable():
                         self.search_query += char
                         self._trigger_search()
-                        self.pending_updates |= UpdateFlags.STATUS
+                        self._mark_dirty(UpdateFlags.STATUS)
                     continue
 
                 # Modalità input numerico
                 if self.number_input_mode:
                     if char.isdigit():
                         self.number_buffer += char
-                        self.pending_updates |= UpdateFlags.INPUT
+                        self._mark_dirty(UpdateFlags.INPUT)
                     elif char in ('\r', '\n'):
                         if self.number_buffer:
                             self.select_by_number(int(self.number_buffer))
                         self.number_input_mode = False
                         self.number_buffer = ""
-                        self.pending_updates |= UpdateFlags.INPUT
+                        self._mark_dirty(UpdateFlags.INPUT)
                     elif char == 'ESC':
                         self.number_input_mode = False
                         self.number_buffer = ""
-                        self.pending_updates |= UpdateFlags.INPUT
+                        self._mark_dirty(UpdateFlags.INPUT)
                     continue
                 
                 # Comandi normali
                 if char.lower() == 'q':
                     logger.info("Richiesta uscita utente")
                     self.running = False
+                    self._wake.set()  # il loop principale esce subito, senza attendere il tick
                 elif char.lower() == 'p' or char == ' ' or char in ('\r', '\n'):
                     self.toggle_play_pause()
                 elif char.lower() == 'm':
@@ -1937,7 +2535,7 @@ class RadioPlayer:
                 elif char.isdigit():
                     self.number_input_mode = True
                     self.number_buffer = char
-                    self.pending_updates |= UpdateFlags.INPUT
+                    self._mark_dirty(UpdateFlags.INPUT)
                 
             except Exception as e:
                 logger.error(f"Errore gestione input: {e}", exc_info=True)
@@ -1965,7 +2563,7 @@ class RadioPlayer:
                     return
             
             # Avvia thread input
-            self.executor.submit(self.handle_input)
+            self._input_future = self.executor.submit(self.handle_input)
             
             # Loop principale con Rich o TUI base
             if self.use_rich:
@@ -1978,15 +2576,16 @@ class RadioPlayer:
         except Exception as e:
             logger.error(f"Errore critico: {e}", exc_info=True)
         finally:
+            self.running = False
+            self._wake_input()
             self.stop()
-            self.metadata_monitor.stop()
             self.executor.shutdown(wait=False)
             self.restore_terminal()
             
             if self.use_rich:
                 self.console.clear()
             else:
-                os.system('clear' if os.name == 'posix' else 'cls')
+                self.clear_screen()
             
             print("👋 Arrivederci!")
             logger.info("Applicazione terminata")
@@ -1995,63 +2594,112 @@ class RadioPlayer:
         """Loop principale con Rich UI"""
         logger.info("Avvio loop Rich UI")
         
-        with Live(self._render_rich(), console=self.console, 
-                 refresh_per_second=10, screen=True) as live:
+        # Niente auto-refresh: si ridisegna solo su richiesta (_mark_dirty)
+        # o allo scadere del tick dell'orologio
+        with Live(self._render_rich(), console=self.console,
+                 auto_refresh=False, screen=True) as live:
             self.live = live
-            
-            last_timer_update = 0
-            
+
+            next_tick = 0.0
+            tick_state = (self.search_mode, self.search_loading)
+
             while self.running:
-                current_time = time.time()
-                
-                # Aggiorna timer ogni secondo
-                if current_time - last_timer_update >= 1.0:
-                    self.pending_updates |= UpdateFlags.TIMER
-                    last_timer_update = current_time
-                
-                # In riproduzione, aggiorna anche info brano ogni secondo (per il tempo)
-                if self.state.is_playing:
-                    self.pending_updates |= UpdateFlags.SONG
-                
-                # Aggiorna status se c'è messaggio temporaneo
-                if self.temp_message and (current_time - self.temp_message_time) < 5:
-                    self.pending_updates |= UpdateFlags.STATUS
-                
-                # SEMPRE renderizza se ci sono aggiornamenti o se sta riproducendo
-                # (per catturare metadata che arrivano dai thread)
-                if self.pending_updates != UpdateFlags.NONE or self.state.is_playing:
-                    live.update(self._render_rich())
-                    self.pending_updates = UpdateFlags.NONE
-                
-                time.sleep(0.1)
+                current_time = time.monotonic()
+
+                # Entrata/uscita dalla ricerca o avvio/fine caricamento cambiano
+                # la cadenza del tick: si ripianifica subito, senza attendere
+                # lo scadere del tick precedente (fino a 1 s)
+                if (self.search_mode, self.search_loading) != tick_state:
+                    tick_state = (self.search_mode, self.search_loading)
+                    interval = self._tick_interval()
+                    next_tick = min(next_tick, current_time + interval - (time.time() % interval))
+
+                # Tick periodico: orologio, tempo brano, scadenza messaggi
+                if current_time >= next_tick:
+                    flags = UpdateFlags.TIMER
+                    if self.state.is_playing:
+                        flags |= UpdateFlags.SONG
+                    if self.temp_message and (current_time - self.temp_message_time) < 5:
+                        flags |= UpdateFlags.STATUS
+                    with self._dirty_lock:
+                        self.pending_updates |= flags
+                    # Allineato al confine del secondo reale: l'orologio
+                    # avanza puntuale e non salta né ripete secondi
+                    interval = self._tick_interval()
+                    next_tick = current_time + interval - (time.time() % interval)
+
+                # Nessun cambiamento dall'ultimo frame: nessun ridisegno
+                if self.pending_updates != UpdateFlags.NONE:
+                    # Budget frame: gli aggiornamenti ravvicinati (tasti ripetuti,
+                    # metadata) confluiscono in un unico frame
+                    budget = self.last_render_time + self.min_render_interval - time.monotonic()
+                    if budget > 0:
+                        time.sleep(budget)
+
+                    flags = self._take_updates()
+                    renderable = self._render_rich(flags)
+                    if renderable is not None:
+                        live.update(renderable, refresh=True)
+                        self.last_render_time = time.monotonic()
+
+                # Dorme fino al prossimo tick o finché un thread non segnala modifiche
+                self._wake.wait(timeout=max(0.0, next_tick - time.monotonic()))
+                self._wake.clear()
+
+    def _tick_interval(self) -> float:
+        """Intervallo del tick periodico (più rapido per le animazioni di ricerca)"""
+        if self.search_mode:
+            return 0.125 if self.search_loading else 0.5
+        return 1.0
     
     def _run_tui_loop(self):
         """Loop principale con TUI base (fallback)"""
         logger.info("Avvio loop TUI base")
         
-        os.system('clear' if os.name == 'posix' else 'cls')
-        print("=" * 70)
-        print("🎵 RADIO PLAYER M3U")
-        print("=" * 70)
-        print("\nModalità TUI base (installa 'rich' per UI migliorata)")
-        print("\nComandi: p=play, q=quit, ↑/↓=seleziona, +/-=volume, m=muto\n")
+        # Pulizia schermo e intestazione in un'unica scrittura
+        banner = [
+            _CLEAR_SEQ + "=" * 70,
+            "🎵 RADIO PLAYER M3U",
+            "=" * 70,
+            "\nModalità TUI base (installa 'rich' per UI migliorata)",
+            "\nComandi: p=play, q=quit, ↑/↓=seleziona, +/-=volume, m=muto\n",
+        ]
+        sys.stdout.write("\n".join(banner) + "\n")
+        sys.stdout.flush()
         
         while self.running:
-            current_time = time.time()
+            current_time = time.monotonic()
             
-            if current_time - self.last_render_time >= 1.0:
+            if (self.pending_updates != UpdateFlags.NONE
+                    or current_time - self.last_render_time >= 1.0):
+                # Stesso budget frame della UI Rich (--max-fps)
+                budget = self.last_render_time + self.min_render_interval - current_time
+                if budget > 0:
+                    time.sleep(budget)
+                self._take_updates()
+                
                 # Aggiornamento base ogni secondo
                 status = "▶️ Playing" if self.state.is_playing else "⏹️ Stopped"
                 
                 if self.state.playing_station_index >= 0:
-                    station = self.stations[self.state.playing_station_index]
-                    print(f"\r{status} | {station.name[:40]:<40} | Vol: {self.state.volume}%", end="", flush=True)
+                    name = self.stations[self.state.playing_station_index].name
                 else:
-                    print(f"\r{status} | {'No station':<40} | Vol: {self.state.volume}%", end="", flush=True)
+                    name = "No station"
+
+                # Campi a larghezza fissa: la riga riscritta con \r copre
+                # sempre per intero la precedente (es. volume 100% -> 95%)
+                line = f"\r{status} | {name[:40]:<40} | Vol: {self.state.volume:>3}%"
+
+                # Riscrive la riga solo se il contenuto è cambiato
+                if line != self._last_tui_line:
+                    sys.stdout.write(line)
+                    sys.stdout.flush()
+                    self._last_tui_line = line
                 
-                self.last_render_time = current_time
-            
-            time.sleep(0.1)
+                self.last_render_time = time.monotonic()
+
+            self._wake.wait(timeout=max(0.0, self.last_render_time + 1.0 - time.monotonic()))
+            self._wake.clear()
 
 # ============================================================================
 # MAIN
@@ -2059,21 +2707,28 @@ class RadioPlayer:
 
 def main():
     """Funzione principale"""
+    parser = argparse.ArgumentParser(description="Radio Player M3U")
+    parser.add_argument("m3u_file", nargs="?", type=Path,
+                        help="file M3U da caricare (default: primo .m3u nella cartella corrente)")
+    parser.add_argument("--max-fps", type=float, default=10,
+                        help="frequenza massima di ridisegno dell'interfaccia (default: 10)")
+    args = parser.parse_args()
+    if args.max_fps <= 0:
+        parser.error("--max-fps deve essere maggiore di 0")
+
     print("=" * 70)
     print("Radio Player M3U v2.0 - VERSIONE MIGLIORATA")
     print("Copyright (C) 2025 Andres Zanzani <azanzani@gmail.com>")
     print("=" * 70)
     print()
     
-    m3u_file = None
-    if len(sys.argv) > 1:
-        m3u_file = Path(sys.argv[1])
-        if not m3u_file.exists():
-            print(f"❌ File non trovato: {m3u_file}")
-            return
+    m3u_file = args.m3u_file
+    if m3u_file is not None and not m3u_file.exists():
+        print(f"❌ File non trovato: {m3u_file}")
+        return
     
     try:
-        player = RadioPlayer()
+        player = RadioPlayer(max_fps=args.max_fps)
         player.run(m3u_file)
     except Exception as e:
         logger.error(f"Errore fatale: {e}", exc_info=True)